@@ -35,6 +35,9 @@ class Assistant(Agent):
     # To add tools, use the @function_tool decorator.
     # Here's an example that adds a simple weather tool.
     # You also have to add `from livekit.agents import function_tool, RunContext` to the top of this file
+    # Tools run on the same event loop as the audio pipeline, so any blocking call inside a tool
+    # (file I/O, a synchronous HTTP client, a local scoring model) must be offloaded with
+    # `await asyncio.to_thread(...)`, otherwise it stalls STT/TTS streaming for every session
     # @function_tool
     # async def lookup_weather(self, context: RunContext, location: str):
     #     """Use this tool to look up current weather information in the given location.
@@ -45,13 +48,16 @@ class Assistant(Agent):
     #         location: The location to look up weather information for (e.g. city name)
     #     """
     #
-    #     logger.info(f"Looking up weather for {location}")
+    #     logger.info("Looking up weather for %s", location)
     #
+    #     # e.g. weather = await asyncio.to_thread(weather_client.fetch, location)
     #     return "sunny with a temperature of 70 degrees."
 
 
 def prewarm(proc: JobProcess):
     proc.userdata["vad"] = silero.VAD.load()
+    # For telephony applications, use `BVCTelephony` for best results
+    proc.userdata["noise_cancellation"] = noise_cancellation.BVC()
 
 
 async def entrypoint(ctx: JobContext):
@@ -109,7 +115,7 @@ async def entrypoint(ctx: JobContext):
 
     async def log_usage():
         summary = usage_collector.get_summary()
-        logger.info(f"Usage: {summary}")
+        logger.info("Usage: %s", summary)
 
     ctx.add_shutdown_callback(log_usage)
 
@@ -126,8 +132,7 @@ async def entrypoint(ctx: JobContext):
         agent=Assistant(),
         room=ctx.room,
         room_input_options=RoomInputOptions(
-            # For telephony applications, use `BVCTelephony` for best results
-            noise_cancellation=noise_cancellation.BVC(),
+            noise_cancellation=ctx.proc.userdata["noise_cancellation"],
         ),
     )
 